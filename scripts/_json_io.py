@@ -0,0 +1,68 @@
+"""
+Shared JSON I/O helpers for the data generator scripts.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise; both paths produce identical output files.
+"""
+
+import json
+import os
+import tempfile
+
+try:
+    import orjson  # Optional: C-accelerated JSON, much faster than stdlib json
+except ImportError:
+    orjson = None
+
+# Process umask, read once (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def dumps(obj):
+    """Serialize JSON-compatible data compactly (bytes with orjson, str otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
+def loads(raw):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json(path):
+    """Read a JSON file in a single call and parse the raw bytes."""
+    return loads(path.read_bytes())
+
+
+def dump_json(data):
+    """Serialize data as 2-space indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_bytes(path, payload):
+    """
+    Write a pre-serialized payload to path atomically.
+
+    The bytes go to a temp file in the same directory which then replaces path,
+    so an interrupted run never leaves a partially written file behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # mkstemp creates owner-only files; give outputs the mode open() would
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -9,10 +9,11 @@ Usage:
     python generate_enterprise_quarterly.py
 """
 
-import json
 import random
 from pathlib import Path
 
+from _json_io import dump_json, dumps, load_json, loads, write_bytes
+
 # Configuration
 BASE_QUARTER = "q3-2024"
 TARGET_QUARTERS = ["q4-2023", "q1-2024", "q2-2024", "q4-2024"]
@@ -66,11 +67,17 @@ def vary_count(count, trend_offset, improvement_trend=True, volatility=0.1):
     return int(round(varied))
 
 
-def generate_quarterly_enterprise_data(baseline_data, quarter):
+def generate_quarterly_enterprise_data(baseline_data, quarter, scorecard_snapshot=None):
     """Generate quarterly variation of enterprise dashboard data."""
     print(f"Generating {quarter.upper()} enterprise data...")
 
-    data = json.loads(json.dumps(baseline_data))  # Deep copy
+    # Shallow copy; only the executive scorecard is varied, so only it gets a
+    # fresh copy, parsed from its serialized snapshot
+    data = dict(baseline_data)
+    if "executiveScorecard" in data:
+        if scorecard_snapshot is None:
+            scorecard_snapshot = dumps(data["executiveScorecard"])
+        data["executiveScorecard"] = loads(scorecard_snapshot)
     trend_offset = QUARTER_TRENDS[quarter]
 
     # Update metadata
@@ -136,19 +143,22 @@ def main():
         print(f"Error: Baseline file not found: {baseline_path}")
         return
 
-    with open(baseline_path, 'r', encoding='utf-8') as f:
-        baseline_data = json.load(f)
+    baseline_data = load_json(baseline_path)
 
     print(f"Loaded baseline: {baseline_path.name}")
     print()
 
+    # Serialize the scorecard once; each quarter parses its own copy from it
+    scorecard_snapshot = None
+    if "executiveScorecard" in baseline_data:
+        scorecard_snapshot = dumps(baseline_data["executiveScorecard"])
+
     # Generate quarterly variations
     for quarter in TARGET_QUARTERS:
-        quarterly_data = generate_quarterly_enterprise_data(baseline_data, quarter)
+        quarterly_data = generate_quarterly_enterprise_data(baseline_data, quarter, scorecard_snapshot)
 
         output_path = DATA_DIR / f"enterprise-dashboard-{quarter}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(quarterly_data, f, indent=2)
+        write_bytes(output_path, dump_json(quarterly_data))
 
         print(f"  Created: {output_path.name}")
 
@@ -5,21 +5,82 @@ Generate quarterly variations of business unit data for Enterprise Audit Dashboa
 This script reads Q3 2024 baseline data and generates realistic quarterly variations
 for Q4 2023, Q1 2024, Q2 2024, and Q4 2024.
 
+Business units whose outputs all exist, are non-empty and are newer than both
+their baseline file and this script are skipped, so a default run does nothing
+while the outputs are current; pass --force to regenerate everything.
+
 Usage:
-    python generate_quarterly_data.py
+    python generate_quarterly_data.py [--force]
 """
 
-import json
+import argparse
 import os
 import random
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
 from pathlib import Path
 from datetime import datetime
 
+from _json_io import dump_json, dumps, load_json, loads, write_bytes
+
 # Configuration
 BASE_QUARTER = "q3-2024"
 TARGET_QUARTERS = ["q4-2023", "q1-2024", "q2-2024", "q4-2024"]
 DATA_DIR = Path(__file__).parent.parent / "data" / "business-units"
+RANDOM_SEED = 42  # Base seed; each business unit derives its own from it
+
+# Metrics varied each quarter, in the order they are varied:
+# (path, improvement_trend, volatility, min_val, max_val, is_count)
+# improvement_trend=True means values improve over time (past=worse, future=better);
+# volatility is the random variation range (0.03 = ±3%)
+COUNT_MIN, COUNT_MAX = 0, 999999
+METRIC_SPECS = (
+    # Executive scorecard: overall score and risk metrics improve, alerts decrease
+    (("executiveScorecard", "overallScore", "value"), True, 0.02, 60, 95, False),
+    (("executiveScorecard", "riskMetrics", "amlCompliance"), True, 0.025, 0, 100, False),
+    (("executiveScorecard", "riskMetrics", "fraudRisk"), True, 0.025, 0, 100, False),
+    (("executiveScorecard", "riskMetrics", "operationalRisk"), True, 0.025, 0, 100, False),
+    (("executiveScorecard", "riskMetrics", "cyberSecurity"), True, 0.025, 0, 100, False),
+    (("executiveScorecard", "alerts", "critical"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("executiveScorecard", "alerts", "high"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("executiveScorecard", "alerts", "medium"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("executiveScorecard", "alerts", "low"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+
+    # Compliance: training, SAR filing and policy acknowledgment improve
+    (("complianceMetrics", "training", "completion", "overall"), True, 0.02, 80, 99, False),
+    (("complianceMetrics", "regulatory", "sarFiling", "timeliness"), True, 0.02, 0, 100, False),
+    (("complianceMetrics", "regulatory", "sarFiling", "quality"), True, 0.02, 0, 100, False),
+    (("complianceMetrics", "regulatory", "sarFiling", "volume"), False, 0.1, COUNT_MIN, COUNT_MAX, True),
+    (("complianceMetrics", "policy", "distribution", "acknowledgment"), True, 0.025, 0, 100, False),
+
+    # Risk: fewer AML alerts, falsePositiveRate and fraud rate decrease
+    (("riskMetrics", "amlMonitoring", "alertVolume", "total"), False, 0.12, COUNT_MIN, COUNT_MAX, True),
+    (("riskMetrics", "amlMonitoring", "effectiveness", "modelAccuracy"), True, 0.03, 0, 100, False),
+    (("riskMetrics", "amlMonitoring", "effectiveness", "falsePositiveRate"), False, 0.03, 0, 100, False),
+    (("riskMetrics", "amlMonitoring", "effectiveness", "reviewEfficiency"), True, 0.03, 0, 100, False),
+    (("riskMetrics", "fraudMetrics", "losses", "rate"), False, 0.08, 0.0001, 0.01, False),
+    (("riskMetrics", "sanctionsScreening", "coverage", "transactions"), True, 0.01, 95, 100, False),
+
+    # Operational: KYC completion improves, falsePositiveRate decreases
+    (("operationalMetrics", "kycCdd", "completion", "new"), True, 0.025, 0, 100, False),
+    (("operationalMetrics", "kycCdd", "periodicReview", "onTime"), True, 0.03, 0, 100, False),
+    (("operationalMetrics", "amlMonitoring", "effectiveness", "modelAccuracy"), True, 0.025, 0, 100, False),
+    (("operationalMetrics", "amlMonitoring", "effectiveness", "falsePositiveRate"), False, 0.025, 0, 100, False),
+    (("operationalMetrics", "amlMonitoring", "effectiveness", "reviewEfficiency"), True, 0.025, 0, 100, False),
+
+    # Audit findings: fewer findings (critical/high decrease more aggressively), pass rate improves
+    (("auditFindings", "summary", "total"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("auditFindings", "summary", "bySeverity", "critical"), False, 0.2, COUNT_MIN, COUNT_MAX, True),
+    (("auditFindings", "summary", "bySeverity", "high"), False, 0.2, COUNT_MIN, COUNT_MAX, True),
+    (("auditFindings", "summary", "bySeverity", "medium"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("auditFindings", "summary", "bySeverity", "low"), False, 0.15, COUNT_MIN, COUNT_MAX, True),
+    (("auditFindings", "testing", "results", "pass"), True, 0.025, 75, 98, False),
+)
+
+# Top-level sections modified by QuarterlyDataGenerator; all others are shared
+# with the baseline instead of being copied. Besides the METRIC_SPECS sections,
+# auditFindings is always written (summary total and finding status flips).
+MUTATED_SECTIONS = tuple(dict.fromkeys([*(spec[0][0] for spec in METRIC_SPECS), "auditFindings"]))
 
 # Trend configurations (relative to Q3 2024 baseline = 0)
 # Negative quarters are in the past, positive are in the future
@@ -32,28 +93,72 @@ QUARTER_TRENDS = {
 }
 
 
+def snapshot_sections(baseline_data):
+    """Serialize the varied sections of a baseline once, for reuse across quarters."""
+    return dumps({
+        section: baseline_data[section]
+        for section in MUTATED_SECTIONS
+        if section in baseline_data
+    })
+
+
+def _vary_kernel(values, trend_factors, random_factors, min_vals, max_vals):
+    """Apply trend and random factors to each value, clamped to its valid range."""
+    return [
+        max(min_val, min(max_val, value * (1 + trend_factor + random_factor)))
+        for value, trend_factor, random_factor, min_val, max_val
+        in zip(values, trend_factors, random_factors, min_vals, max_vals)
+    ]
+
+
+def _compile_metric_specs(specs):
+    """
+    Specialize metric specs for slot resolution.
+
+    Consecutive specs that share a parent container are grouped as
+    (parent_path, ((key, improvement_trend, volatility, min_val, max_val, is_count), ...))
+    so each container is looked up once; spec order, and so draw order, is kept.
+    """
+    return tuple(
+        (parent_path, tuple((spec[0][-1],) + spec[1:] for spec in group))
+        for parent_path, group in groupby(specs, key=lambda spec: spec[0][:-1])
+    )
+
+
+_COMPILED_METRIC_SPECS = _compile_metric_specs(METRIC_SPECS)
+
+
 class QuarterlyDataGenerator:
     """Generate realistic quarterly variations of business unit data."""
 
-    def __init__(self, baseline_data, quarter, business_unit_name):
-        self.data = copy.deepcopy(baseline_data)
+    def __init__(self, baseline_data, quarter, business_unit_name, sections_snapshot=None, rng=None):
+        # Shallow copy, then replace the varied sections with fresh copies parsed
+        # from their serialized snapshot (see snapshot_sections)
+        if sections_snapshot is None:
+            sections_snapshot = snapshot_sections(baseline_data)
+        self.data = dict(baseline_data)
+        self.data.update(loads(sections_snapshot))
         self.quarter = quarter
         self.business_unit_name = business_unit_name
         self.trend_offset = QUARTER_TRENDS[quarter]
+        # Random source; pass a seeded random.Random for reproducible output
+        self.rng = rng if rng is not None else random.Random()
+        # Trend component: gradual improvement/degradation over quarters (1.5% per quarter)
+        self._trend_up = self.trend_offset * 0.015
+        self._trend_down = -self._trend_up
+        # (container, key) slots for every metric in METRIC_SPECS present in the data
+        self._slots = self.resolve_metric_slots()
 
     def generate(self):
         """Apply all transformations to generate quarterly data."""
-        print(f"  Generating {self.quarter} data for {self.business_unit_name}...")
-
         # Update metadata
         self.update_metadata()
 
-        # Apply variations to different sections
-        self.vary_executive_scorecard()
-        self.vary_compliance_metrics()
-        self.vary_risk_metrics()
-        self.vary_operational_metrics()
-        self.vary_audit_findings()
+        # Vary all metrics in one pass
+        self.vary_metrics()
+
+        # Steps that depend on the varied values
+        self.finalize_audit_findings()
 
         return self.data
 
@@ -71,245 +176,89 @@ class QuarterlyDataGenerator:
         }
         self.data["date"] = quarter_dates[self.quarter]
 
-    def vary_value(self, value, improvement_trend=True, volatility=0.03, min_val=0, max_val=100):
+    def resolve_metric_slots(self):
         """
-        Apply realistic variation to a numeric value.
-
-        Args:
-            value: Base value to vary
-            improvement_trend: If True, values improve over time (past=worse, future=better)
-            volatility: Random variation range (0.03 = ±3%)
-            min_val: Minimum allowed value
-            max_val: Maximum allowed value
+        Resolve METRIC_SPECS paths against self.data.
+
+        Returns a list of (container, key, value, trend_factor, volatility,
+        min_val, max_val, is_count) tuples. Missing and None metrics, as well
+        as zero counts, are left out since they are never varied.
         """
-        if value is None:
-            return None
-
-        # Trend component: gradual improvement/degradation over quarters
-        trend_direction = 1 if improvement_trend else -1
-        trend_factor = self.trend_offset * 0.015 * trend_direction  # 1.5% per quarter
-
-        # Random component: quarter-to-quarter volatility
-        random_factor = random.uniform(-volatility, volatility)
-
-        # Apply variations
-        varied = value * (1 + trend_factor + random_factor)
-
-        # Clamp to valid range
-        return max(min_val, min(max_val, varied))
-
-    def vary_count(self, count, improvement_trend=True, volatility=0.1):
-        """Vary integer counts with realistic variations."""
-        if count is None or count == 0:
-            return count
-
-        varied = self.vary_value(count, improvement_trend, volatility, min_val=0, max_val=999999)
-        return int(round(varied))
-
-    def vary_executive_scorecard(self):
-        """Vary executive scorecard metrics."""
-        scorecard = self.data.get("executiveScorecard", {})
-
-        # Overall score improves over time
-        if "overallScore" in scorecard and "value" in scorecard["overallScore"]:
-            scorecard["overallScore"]["value"] = self.vary_value(
-                scorecard["overallScore"]["value"],
-                improvement_trend=True,
-                volatility=0.02,
-                min_val=60,
-                max_val=95
-            )
-
-        # Risk metrics (lower is better, so improvement_trend=False means they decrease)
-        risk_metrics = scorecard.get("riskMetrics", {})
-        for key in ["amlCompliance", "fraudRisk", "operationalRisk", "cyberSecurity"]:
-            if key in risk_metrics:
-                risk_metrics[key] = self.vary_value(
-                    risk_metrics[key],
-                    improvement_trend=True,
-                    volatility=0.025
-                )
-
-        # Alert counts (should decrease over time)
-        alerts = scorecard.get("alerts", {})
-        for severity in ["critical", "high", "medium", "low"]:
-            if severity in alerts:
-                alerts[severity] = self.vary_count(
-                    alerts[severity],
-                    improvement_trend=False,  # Fewer alerts over time
-                    volatility=0.15
-                )
-
-    def vary_compliance_metrics(self):
-        """Vary compliance metrics."""
-        compliance = self.data.get("complianceMetrics", {})
-
-        # Training completion improves over time
-        training = compliance.get("training", {})
-        if "completion" in training and "overall" in training["completion"]:
-            training["completion"]["overall"] = self.vary_value(
-                training["completion"]["overall"],
-                improvement_trend=True,
-                volatility=0.02,
-                min_val=80,
-                max_val=99
-            )
-
-        # SAR Filing metrics
-        regulatory = compliance.get("regulatory", {})
-        sar = regulatory.get("sarFiling", {})
-        if "timeliness" in sar:
-            sar["timeliness"] = self.vary_value(sar["timeliness"], improvement_trend=True, volatility=0.02)
-        if "quality" in sar:
-            sar["quality"] = self.vary_value(sar["quality"], improvement_trend=True, volatility=0.02)
-        if "volume" in sar:
-            sar["volume"] = self.vary_count(sar["volume"], improvement_trend=False, volatility=0.1)
-
-        # Policy metrics
-        policy = compliance.get("policy", {})
-        if "distribution" in policy and "acknowledgment" in policy["distribution"]:
-            policy["distribution"]["acknowledgment"] = self.vary_value(
-                policy["distribution"]["acknowledgment"],
-                improvement_trend=True,
-                volatility=0.025
-            )
-
-    def vary_risk_metrics(self):
-        """Vary risk metrics."""
-        risk = self.data.get("riskMetrics", {})
-
-        # AML Monitoring
-        aml = risk.get("amlMonitoring", {})
-        if "alertVolume" in aml and "total" in aml["alertVolume"]:
-            aml["alertVolume"]["total"] = self.vary_count(
-                aml["alertVolume"]["total"],
-                improvement_trend=False,  # Fewer alerts is better
-                volatility=0.12
-            )
-
-        effectiveness = aml.get("effectiveness", {})
-        for metric in ["modelAccuracy", "falsePositiveRate", "reviewEfficiency"]:
-            if metric in effectiveness:
-                # falsePositiveRate should decrease
-                trend = False if metric == "falsePositiveRate" else True
-                effectiveness[metric] = self.vary_value(
-                    effectiveness[metric],
-                    improvement_trend=trend,
-                    volatility=0.03
-                )
-
-        # Fraud metrics
-        fraud = risk.get("fraudMetrics", {})
-        if "losses" in fraud and "rate" in fraud["losses"]:
-            fraud["losses"]["rate"] = self.vary_value(
-                fraud["losses"]["rate"],
-                improvement_trend=False,  # Lower fraud rate is better
-                volatility=0.08,
-                min_val=0.0001,
-                max_val=0.01
-            )
-
-        # Sanctions screening
-        sanctions = risk.get("sanctionsScreening", {})
-        if "coverage" in sanctions and "transactions" in sanctions["coverage"]:
-            sanctions["coverage"]["transactions"] = self.vary_value(
-                sanctions["coverage"]["transactions"],
-                improvement_trend=True,
-                volatility=0.01,
-                min_val=95,
-                max_val=100
-            )
-
-    def vary_operational_metrics(self):
-        """Vary operational metrics."""
-        ops = self.data.get("operationalMetrics", {})
-
-        # KYC metrics
-        kyc = ops.get("kycCdd", {})
-        if "completion" in kyc and "new" in kyc["completion"]:
-            kyc["completion"]["new"] = self.vary_value(
-                kyc["completion"]["new"],
-                improvement_trend=True,
-                volatility=0.025
-            )
-        if "periodicReview" in kyc and "onTime" in kyc["periodicReview"]:
-            kyc["periodicReview"]["onTime"] = self.vary_value(
-                kyc["periodicReview"]["onTime"],
-                improvement_trend=True,
-                volatility=0.03
-            )
-
-        # AML monitoring
-        aml_mon = ops.get("amlMonitoring", {})
-        if "effectiveness" in aml_mon:
-            for metric in ["modelAccuracy", "falsePositiveRate", "reviewEfficiency"]:
-                if metric in aml_mon["effectiveness"]:
-                    trend = False if metric == "falsePositiveRate" else True
-                    aml_mon["effectiveness"][metric] = self.vary_value(
-                        aml_mon["effectiveness"][metric],
-                        improvement_trend=trend,
-                        volatility=0.025
-                    )
-
-    def vary_audit_findings(self):
-        """Vary audit findings."""
+        slots = []
+        for parent_path, metrics in _COMPILED_METRIC_SPECS:
+            container = self.data
+            for key in parent_path:
+                container = container.get(key)
+                if not isinstance(container, dict):
+                    break
+            else:
+                for key, improvement_trend, volatility, min_val, max_val, is_count in metrics:
+                    value = container.get(key)
+                    if value is None or (is_count and value == 0):
+                        continue
+
+                    trend_factor = self._trend_up if improvement_trend else self._trend_down
+                    slots.append((container, key, value, trend_factor, volatility, min_val, max_val, is_count))
+
+        return slots
+
+    def vary_metrics(self):
+        """Vary every resolved metric slot in a single pass and write them back."""
+        if not self._slots:
+            return
+
+        containers, keys, values, trend_factors, volatilities, min_vals, max_vals, is_counts = zip(*self._slots)
+
+        # Random component: quarter-to-quarter volatility. Draw one batch of unit
+        # variates in [-1, 1) and scale each by its metric's volatility.
+        rand = self.rng.random
+        random_factors = [(2.0 * rand() - 1.0) * volatility for volatility in volatilities]
+
+        varied = _vary_kernel(values, trend_factors, random_factors, min_vals, max_vals)
+
+        for container, key, new_value, is_count in zip(containers, keys, varied, is_counts):
+            container[key] = int(round(new_value)) if is_count else new_value
+
+    def finalize_audit_findings(self):
+        """Derive audit finding fields from the varied metrics."""
         findings = self.data.get("auditFindings", {})
 
-        # Summary counts (should improve/decrease over time)
+        # Recalculate total from severity breakdown
         summary = findings.get("summary", {})
-        if "total" in summary:
-            summary["total"] = self.vary_count(
-                summary["total"],
-                improvement_trend=False,  # Fewer findings is better
-                volatility=0.15
-            )
-
-        # By severity
         by_severity = summary.get("bySeverity", {})
-        for severity in ["critical", "high", "medium", "low"]:
-            if severity in by_severity:
-                # Critical and high should decrease more aggressively
-                vol = 0.2 if severity in ["critical", "high"] else 0.15
-                by_severity[severity] = self.vary_count(
-                    by_severity[severity],
-                    improvement_trend=False,
-                    volatility=vol
-                )
-
-        # Recalculate total from severity breakdown
         if by_severity:
             summary["total"] = sum(by_severity.values())
 
-        # Testing results (pass rate should improve)
-        testing = findings.get("testing", {})
-        results = testing.get("results", {})
-        if "pass" in results:
-            results["pass"] = self.vary_value(
-                results["pass"],
-                improvement_trend=True,
-                volatility=0.025,
-                min_val=75,
-                max_val=98
-            )
-
         # Individual findings list
-        findings_list = findings.get("findings", [])
+        self.flip_finding_statuses(findings.get("findings", []))
+
+    def flip_finding_statuses(self, findings_list):
+        """Randomly close findings in future quarters and reopen them in past quarters."""
+        if self.trend_offset > 0:
+            from_status, to_status, probability = "Open", "Closed", 0.3  # 30% chance to close
+        elif self.trend_offset < 0:
+            from_status, to_status, probability = "Closed", "Open", 0.2  # 20% chance to reopen
+        else:
+            return
+
+        # Direction and probability are fixed for the quarter; only eligible findings draw
+        rand = self.rng.random
         for finding in findings_list:
-            # Vary dates slightly
-            # Randomly close some findings in future quarters
-            if self.trend_offset > 0 and finding.get("status") == "Open":
-                if random.random() < 0.3:  # 30% chance to close
-                    finding["status"] = "Closed"
-
-            # Reopen some findings in past quarters
-            if self.trend_offset < 0 and finding.get("status") == "Closed":
-                if random.random() < 0.2:  # 20% chance to reopen
-                    finding["status"] = "Open"
+            if finding.get("status") == from_status and rand() < probability:
+                finding["status"] = to_status
 
 
 def load_baseline_data():
     """Load all Q3 2024 baseline data files."""
-    baseline_files = list(DATA_DIR.glob(f"*-{BASE_QUARTER}.json"))
+    # scandir reports entry types from the directory listing itself, so no
+    # per-file stat() is needed; sort for a stable processing order
+    suffix = f"-{BASE_QUARTER}.json"
+    with os.scandir(DATA_DIR) as entries:
+        baseline_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+        )
 
     if not baseline_files:
         raise FileNotFoundError(f"No baseline data files found in {DATA_DIR}")
@@ -318,33 +267,61 @@ def load_baseline_data():
     return baseline_files
 
 
-def generate_quarterly_data(baseline_file, quarter):
-    """Generate quarterly variation of a single business unit."""
-    # Load baseline data
-    with open(baseline_file, 'r', encoding='utf-8') as f:
-        baseline_data = json.load(f)
+def load_baseline_file(baseline_file):
+    """Load a single baseline business unit file."""
+    return load_json(baseline_file)
 
+
+def get_output_path(baseline_file, quarter):
+    """Return the output path for a baseline file's quarterly variation."""
+    baseline_name = baseline_file.stem  # e.g., "consumer-banking-q3-2024"
+    base_name = baseline_name.replace(f"-{BASE_QUARTER}", "")  # e.g., "consumer-banking"
+    return DATA_DIR / f"{base_name}-{quarter}.json"
+
+
+def is_up_to_date(baseline_file):
+    """Check whether every quarterly output is non-empty and newer than its baseline and this script."""
+    source_mtime = max(baseline_file.stat().st_mtime, Path(__file__).stat().st_mtime)
+    for quarter in TARGET_QUARTERS:
+        try:
+            output_stat = get_output_path(baseline_file, quarter).stat()
+        except FileNotFoundError:
+            return False
+        # An empty file is never valid output (e.g. left behind by an interrupted run)
+        if output_stat.st_size == 0 or output_stat.st_mtime < source_mtime:
+            return False
+    return True
+
+
+def generate_quarterly_data(baseline_file, baseline_data, quarter, sections_snapshot=None, rng=None):
+    """Generate quarterly variation of a single business unit."""
     business_unit_name = baseline_data.get("name", "Unknown")
 
     # Generate variation
-    generator = QuarterlyDataGenerator(baseline_data, quarter, business_unit_name)
+    generator = QuarterlyDataGenerator(baseline_data, quarter, business_unit_name, sections_snapshot, rng)
     quarterly_data = generator.generate()
 
-    # Create output filename
-    baseline_name = baseline_file.stem  # e.g., "consumer-banking-q3-2024"
-    base_name = baseline_name.replace(f"-{BASE_QUARTER}", "")  # e.g., "consumer-banking"
-    output_name = f"{base_name}-{quarter}.json"
-    output_path = DATA_DIR / output_name
-
     # Write output file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(quarterly_data, f, indent=2)
+    output_path = get_output_path(baseline_file, quarter)
+    write_bytes(output_path, dump_json(quarterly_data))
 
-    print(f"  Created: {output_name}")
     return output_path
 
 
-def main():
+def generate_business_unit(baseline_file):
+    """Generate all target quarters for one baseline file (runs in a worker process)."""
+    # Independent generator per business unit so output does not depend on worker scheduling
+    rng = random.Random(f"{RANDOM_SEED}:{baseline_file.name}")
+
+    baseline_data = load_baseline_file(baseline_file)
+    sections_snapshot = snapshot_sections(baseline_data)
+    return [
+        generate_quarterly_data(baseline_file, baseline_data, quarter, sections_snapshot, rng)
+        for quarter in TARGET_QUARTERS
+    ]
+
+
+def main(force=False):
     """Main execution function."""
     print("=" * 70)
     print("Enterprise Audit Dashboard - Quarterly Data Generator")
@@ -359,14 +336,26 @@ def main():
     baseline_files = load_baseline_data()
     print()
 
-    # Generate quarterly variations
-    total_generated = 0
-    for quarter in TARGET_QUARTERS:
-        print(f"Generating {quarter.upper()} data...")
+    # Skip business units whose outputs are already up to date
+    if not force:
+        stale_files = [f for f in baseline_files if not is_up_to_date(f)]
         for baseline_file in baseline_files:
-            generate_quarterly_data(baseline_file, quarter)
-            total_generated += 1
-        print()
+            if baseline_file not in stale_files:
+                print(f"Up to date: {baseline_file.name}")
+        baseline_files = stale_files
+
+    # Generate quarterly variations, processing baseline files in parallel
+    total_generated = 0
+    if baseline_files:
+        max_workers = min(len(baseline_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(generate_business_unit, baseline_files)
+            for baseline_file, output_paths in zip(baseline_files, results):
+                print(f"Processed {baseline_file.name}")
+                for output_path in output_paths:
+                    print(f"  Created: {output_path.name}")
+                total_generated += len(output_paths)
+    print()
 
     print("=" * 70)
     print(f"✓ Successfully generated {total_generated} quarterly data files")
@@ -375,6 +364,10 @@ def main():
 
 
 if __name__ == "__main__":
-    # Set random seed for reproducibility (optional)
-    random.seed(42)
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate quarterly variations of business unit data.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate outputs even if they are newer than their baseline"
+    )
+    main(force=parser.parse_args().force)
\ No newline at end of file